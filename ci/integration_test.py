@@ -29,14 +29,18 @@ class TestLatexBuild(unittest.TestCase):
             self.assertTrue(os.path.isfile("acronyms.list"))
             self.assertTrue(os.path.isfile("localization.warnings"))
             self.assertTrue(os.path.isfile("localization.list"))
+            self.assertTrue(os.path.isfile("localization.details"))
         cleanup_list = [
+            "acronyms.details",
             "acronyms.list",
             "acronyms.warnings",
+            "hyphenations.details",
             "hyphenations.list",
             "hyphenations.warnings",
             "integration_test.aux",
             "integration_test.log",
             "integration_test.pdf",
+            "localization.details",
             "localization.list",
             "localization.warnings",
             "std.out",
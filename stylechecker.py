@@ -3,15 +3,25 @@
 and responses results are printed to stdout."""
 
 
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 import argparse
+import array
+import bisect
+import collections
+import concurrent.futures
 import dataclasses
 import enum
+import functools
+import gc
 import os
 import re
+import struct
+import sys
+import time
 
 
 Tokens = List[Tuple[str, int]]
+CommandIndex = Dict[str, List["TexNode"]]
 
 
 class NodeType(enum.Enum):
@@ -56,6 +66,88 @@ class TexNode:
             return f"└── {self.type} ({self.lineno}): " + self.content.replace("\n", "")
 
 
+class LazyTexNode(TexNode):
+    """A node whose child is only parsed from the tokens of its brace group
+    the first time the child is accessed.  Subtrees that are never inspected
+    (e.g. macro definitions in the preamble) are then never built.
+
+    Args:
+        contents - the text contained within a node.
+        type - whether the node is a command, text, or comment.
+        lineno - line number in the .tex file where this node occurs.
+        tokens - the group's tokens, in the reversed order parse expects,
+            up to and including the closing brace.
+        tree - the TexTree the node belongs to, whose command index is
+            rebuilt once the group is parsed.
+    """
+
+    def __init__(
+        self,
+        content: str,
+        type: NodeType,
+        lineno: int,
+        tokens: Tokens,
+        tree: Optional["TexTree"] = None,
+    ) -> None:
+        super().__init__(content, type, lineno)
+        self.tokens = tokens
+        self.tree = tree
+
+    @property
+    def child(self) -> Optional[TexNode]:
+        """The first node in the brace group, parsed on first access."""
+        if self.tokens is not None:
+            _, child = TexTree.parse(self.tokens, True, self.tree)
+            child.parent = self
+            self.child = TexTree.prune(child)
+            if self.tree is not None:
+                self.tree.index = None
+        return self._child
+
+    @child.setter
+    def child(self, child: Optional[TexNode]) -> None:
+        self._child = child
+        self.tokens = None
+
+    def __repr__(self) -> str:
+        """Describe the node without parsing its brace group."""
+        return (
+            f"LazyTexNode(content={self.content!r}, type={self.type}, "
+            f"lineno={self.lineno}, parsed={self.tokens is None})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Compare two nodes without parsing their brace groups.  Nodes are
+        equal if their content, type and line number match, and either both
+        groups are still unparsed with the same tokens or both parsed groups
+        hold the same nodes.  Parsed groups are walked iteratively and only
+        compare content, type and line number, since a node's parent links
+        back to this node."""
+        if not isinstance(other, LazyTexNode):
+            return NotImplemented
+        pairs = [(self, other)]
+        while pairs:
+            a, b = pairs.pop()
+            if a is None or b is None:
+                if a is not b:
+                    return False
+                continue
+            if (a.content, a.type, a.lineno) != (b.content, b.type, b.lineno):
+                return False
+            a_tokens = getattr(a, "tokens", None)
+            b_tokens = getattr(b, "tokens", None)
+            if a_tokens is not None or b_tokens is not None:
+                if a_tokens != b_tokens:
+                    return False
+            else:
+                a_child = a._child if isinstance(a, LazyTexNode) else a.child
+                b_child = b._child if isinstance(b, LazyTexNode) else b.child
+                pairs.append((a_child, b_child))
+            if a is not self:
+                pairs.append((a.next, b.next))
+        return True
+
+
 class TexTree(object):
     """Represent the contents of a LaTeX document as a tree.  In this tree
     each node's child represents an element contained within it.  For
@@ -65,19 +157,32 @@ class TexTree(object):
     linked-list at each child.  Elements of this linked-list can also contain
     their own children.
 
+    Once parsed, every command node in the tree is indexed by its name (e.g.
+    '\\input'), so all uses of a command can be found without traversing
+    the tree.
+
     Args:
         tex - string of the LaTeX document being analyzed.
+        lazy - if True, brace groups are only parsed when a node's child is
+            first accessed.  Commands inside a group are only indexed once
+            the group has been parsed.
     """
 
-    def __init__(self, tex: str) -> None:
+    MAGIC = b"TXTR"
+    VERSION = 1
+    HEADER = struct.Struct("<4sHIII")
+    COMMAND_NAME = re.compile(r"\\(?:[A-Za-z@]+\*?|.)?")
+
+    def __init__(self, tex: str, lazy: bool = False) -> None:
         tokens = TexTree.tokenize(tex)
         tokens.reverse()
-        tokens, root = TexTree.parse(tokens)
+        tokens, root = TexTree.parse(tokens, lazy, self)
         assert len(tokens) <= 0, (
             "Sorry, I wasn't able to parse the LaTeX document, please "
             "check for unmatched {, [, ], or }"
         )
         self.root = TexTree.prune(root)
+        self.index = TexTree.build_index(self.root)
 
     def __str__(self) -> str:
         """Print the tree like the Unix tree command."""
@@ -112,6 +217,192 @@ class TexTree(object):
                 return self.node
         raise StopIteration
 
+    def commands(self, name: str) -> List[TexNode]:
+        """Find every use of a command.
+
+        Args:
+            name: name of the command, with or without the leading
+                backslash, e.g. 'input' or '\\usepackage'.
+
+        Returns:
+            The command's nodes in document order.  The argument of each
+            command (if any) is the node's child.  In a lazy tree, commands
+            inside brace groups that have not been parsed yet are not found.
+        """
+        if not name.startswith("\\"):
+            name = "\\" + name
+        if self.index is None:
+            self.index = TexTree.build_index(self.root)
+        return self.index.get(name, [])
+
+    def environments(self, name: str) -> List[TexNode]:
+        """Find every use of an environment.
+
+        Args:
+            name: name of the environment, e.g. 'verbatim'.
+
+        Returns:
+            The '\\begin' nodes opening the environment in document order.
+            In a lazy tree, environments inside brace groups that have not
+            been parsed yet are not found.
+        """
+        return [
+            node
+            for node in self.commands("begin")
+            if node.child and node.child.content == name
+        ]
+
+    def dumps(self) -> bytes:
+        """Serialize the tree to a compact binary format, e.g. to cache it on
+        disk or send it to another process.  The format is a header followed
+        by a table of unique strings and a flat table of nodes in depth first
+        order, stored as one typed column per field:
+
+            header: magic, version, number of nodes, number of strings,
+                size of the string text in bytes
+            strings: character length of each string, then the UTF-8 text of
+                all strings concatenated
+            nodes: type, line number, index into the string table, index of
+                the node's child and index of the next node (-1 if none)
+
+        Returns:
+            The serialized tree.
+        """
+        nodes = []
+        stack = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            nodes.append(node)
+            if node.next:
+                stack.append(node.next)
+            if node.child:
+                stack.append(node.child)
+        index = {id(node): i for i, node in enumerate(nodes)}
+        strings = {}
+        contents = array.array(
+            "I", [strings.setdefault(n.content, len(strings)) for n in nodes]
+        )
+        columns = [
+            array.array("I", [len(x) for x in strings]),
+            array.array("B", [n.type.value for n in nodes]),
+            array.array("I", [n.lineno for n in nodes]),
+            contents,
+            array.array("i", [index[id(n.child)] if n.child else -1 for n in nodes]),
+            array.array("i", [index[id(n.next)] if n.next else -1 for n in nodes]),
+        ]
+        if sys.byteorder != "little":
+            for column in columns:
+                column.byteswap()
+        text = "".join(strings).encode("utf-8")
+        header = TexTree.HEADER.pack(
+            TexTree.MAGIC, TexTree.VERSION, len(nodes), len(strings), len(text)
+        )
+        return (
+            header
+            + columns[0].tobytes()
+            + text
+            + b"".join(column.tobytes() for column in columns[1:])
+        )
+
+    @classmethod
+    def loads(cls, data: bytes) -> "TexTree":
+        """Rebuild a tree serialized with dumps without parsing the LaTeX
+        source again.
+
+        Args:
+            data: the serialized tree.
+
+        Returns:
+            The deserialized TexTree.
+
+        Raises:
+            ValueError: if the data is not a complete, well-formed tree in a
+                supported version of the format.
+        """
+        if len(data) < TexTree.HEADER.size:
+            raise ValueError("Truncated serialized TexTree")
+        header = TexTree.HEADER.unpack_from(data)
+        magic, version, n_nodes, n_strings, text_size = header
+        if magic != TexTree.MAGIC or version != TexTree.VERSION:
+            raise ValueError("Unsupported serialized TexTree format")
+        offset = TexTree.HEADER.size
+
+        def column(typecode: str, n: int) -> array.array:
+            nonlocal offset
+            col = array.array(typecode)
+            if offset + n * col.itemsize > len(data):
+                raise ValueError("Truncated serialized TexTree")
+            col.frombytes(data[offset : offset + n * col.itemsize])
+            if sys.byteorder != "little":
+                col.byteswap()
+            offset += n * col.itemsize
+            return col
+
+        lengths = column("I", n_strings)
+        if offset + text_size > len(data):
+            raise ValueError("Truncated serialized TexTree")
+        text = data[offset : offset + text_size].decode("utf-8")
+        offset += text_size
+        strings = []
+        pos = 0
+        for length in lengths:
+            strings.append(text[pos : pos + length])
+            pos += length
+        types = column("B", n_nodes)
+        linenos = column("I", n_nodes)
+        contents = column("I", n_nodes)
+        children = column("i", n_nodes)
+        nexts = column("i", n_nodes)
+        node_types = {t.value: t for t in NodeType}
+        links = children + nexts
+        if (
+            offset != len(data)
+            or pos != len(text)
+            or not set(types) <= set(node_types)
+            or max(contents, default=-1) >= n_strings
+            or min(links, default=-1) < -1
+            or max(links, default=-1) >= n_nodes
+        ):
+            raise ValueError("Corrupt serialized TexTree")
+        # Nodes are stored in depth first order, so every link points forward
+        # and a node's child directly follows it.  This rules out cycles and
+        # nodes shared between two parents.
+        referenced = [link for link in links if link >= 0]
+        if (
+            any(child not in (-1, i + 1) for i, child in enumerate(children))
+            or any(0 <= following <= i for i, following in enumerate(nexts))
+            or len(referenced) != len(set(referenced))
+            or any(
+                node_types[type] == NodeType.COMMAND
+                and not strings[content].startswith("\\")
+                for type, content in zip(types, contents)
+            )
+        ):
+            raise ValueError("Corrupt serialized TexTree")
+        # The nodes only reference each other, so collecting while they are
+        # created repeatedly scans a graph that cannot be garbage yet.
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            nodes = [
+                TexNode(strings[content], node_types[type], lineno)
+                for type, lineno, content in zip(types, linenos, contents)
+            ]
+        finally:
+            if gc_enabled:
+                gc.enable()
+        for node, child, following in zip(nodes, children, nexts):
+            if child >= 0:
+                node.child = nodes[child]
+                node.child.parent = node
+            if following >= 0:
+                node.next = nodes[following]
+                node.next.prev = node
+        tree = cls.__new__(cls)
+        tree.root = nodes[0] if nodes else None
+        tree.index = TexTree.build_index(tree.root)
+        return tree
+
     @staticmethod
     def tostring(node: TexNode, depth: List[bool]) -> str:
         """Print an individual node of the tree in its place in the larger
@@ -158,7 +449,98 @@ class TexTree(object):
         return tokens
 
     @staticmethod
-    def parse(tokens: Tokens) -> Tuple[Tokens, TexNode]:
+    def make_node(
+        content: str,
+        type: NodeType,
+        lineno: int,
+        group: Optional[Tokens] = None,
+        tree: Optional["TexTree"] = None,
+    ) -> TexNode:
+        """Create a node while parsing.
+
+        Args:
+            content: unstripped text contained within the node.
+            type: whether the node is a command, text, or comment.
+            lineno: line number in the .tex file where the node occurs.
+            group: tokens of the node's brace group, if its child should be
+                parsed lazily.
+            tree: the TexTree the node belongs to, if its child is parsed
+                lazily.
+
+        Returns:
+            The new node.
+        """
+        if group is None:
+            return TexNode(content.strip(), type, lineno)
+        return LazyTexNode(content.strip(), type, lineno, group, tree)
+
+    @staticmethod
+    def build_index(root: Optional[TexNode]) -> CommandIndex:
+        """Index every command node in a tree by its name, in document order.
+        Brace groups that have not been parsed yet are skipped.
+
+        Args:
+            root: root node of the TexTree.
+
+        Returns:
+            A dictionary from command name to the command's nodes.
+        """
+        index = {}
+        stack = [root] if root else []
+        while stack:
+            node = stack.pop()
+            if node.type == NodeType.COMMAND:
+                TexTree.add_command(index, node)
+            if node.next:
+                stack.append(node.next)
+            if getattr(node, "tokens", None) is None and node.child:
+                stack.append(node.child)
+        return index
+
+    @staticmethod
+    def add_command(index: CommandIndex, node: TexNode) -> None:
+        """Add a command node to a command index under its name, e.g.
+        '\\textbf' for the node '\\textbf' or '\\item' for '\\item Text'."""
+        name = TexTree.COMMAND_NAME.match(node.content).group(0)
+        index.setdefault(name, []).append(node)
+
+    @staticmethod
+    def group(tokens: Tokens) -> Tokens:
+        """Remove the tokens of a brace group from a list of tokens without
+        parsing them.  Braces inside comments are skipped, just as in parse.
+
+        Args:
+            tokens: reversed list of tokens, starting just after the opening
+                brace.
+
+        Returns:
+            The reversed tokens of the group, up to and including the closing
+            brace (or the rest of the tokens if the group is never closed).
+        """
+        depth = 1
+        comment = False
+        i = len(tokens)
+        while i > 0 and depth > 0:
+            i -= 1
+            tok = tokens[i][0]
+            if tok == "\n":
+                comment = False
+            elif comment:
+                continue
+            elif tok == "%":
+                comment = True
+            elif tok == "{":
+                depth += 1
+            elif tok == "}":
+                depth -= 1
+        group = tokens[i:]
+        del tokens[i:]
+        return group
+
+    @staticmethod
+    def parse(
+        tokens: Tokens, lazy: bool = False, tree: Optional["TexTree"] = None
+    ) -> Tuple[Tokens, TexNode]:
         """Build self from a list of tokens.
 
         Note 1: currently arguments to command in [] are ignored and treated
@@ -170,6 +552,10 @@ class TexTree(object):
 
         Args:
             tokens: list of tokens from a LaTeX document
+            lazy: if True, only record the tokens of each brace group and
+                parse them when the group is first accessed.
+            tree: the TexTree being built, whose command index is rebuilt
+                when a lazily parsed group is accessed.
         """
         root = TexNode("", NodeType.ROOT, 0)
         curr_node = root
@@ -178,28 +564,38 @@ class TexTree(object):
         while len(tokens) != 0:
             tok = tokens.pop()
             if tok[0] == "%" and curr_type != NodeType.COMMENT:
-                next_node = TexNode(curr_content.strip(), curr_type, tok[1])
+                next_node = TexTree.make_node(curr_content, curr_type, tok[1])
                 curr_node.next = next_node
                 next_node.prev = curr_node
                 curr_node = next_node
                 curr_content = ""
                 curr_type = NodeType.COMMENT
             elif tok[0] == "\n":
-                next_node = TexNode(curr_content.strip(), curr_type, tok[1])
+                next_node = TexTree.make_node(curr_content, curr_type, tok[1])
                 curr_node.next = next_node
                 next_node.prev = curr_node
                 curr_node = next_node
                 curr_content = ""
                 curr_type = NodeType.TEXT
             elif tok[0] == "\\" and curr_type != NodeType.COMMENT:
-                next_node = TexNode(curr_content.strip(), curr_type, tok[1])
+                next_node = TexTree.make_node(curr_content, curr_type, tok[1])
                 curr_node.next = next_node
                 next_node.prev = curr_node
                 curr_node = next_node
                 curr_content = "\\"
                 curr_type = NodeType.COMMAND
+            elif tok[0] == "{" and curr_type != NodeType.COMMENT and lazy:
+                group = TexTree.group(tokens)
+                next_node = TexTree.make_node(
+                    curr_content, curr_type, tok[1], group, tree
+                )
+                curr_node.next = next_node
+                next_node.prev = curr_node
+                curr_node = next_node
+                curr_content = ""
+                curr_type = NodeType.TEXT
             elif tok[0] == "{" and curr_type != NodeType.COMMENT:
-                next_node = TexNode(curr_content.strip(), curr_type, tok[1])
+                next_node = TexTree.make_node(curr_content, curr_type, tok[1])
                 tokens, next_node.child = TexTree.parse(tokens)
                 next_node.child.parent = next_node
                 curr_node.next = next_node
@@ -208,7 +604,7 @@ class TexTree(object):
                 curr_content = ""
                 curr_type = NodeType.TEXT
             elif tok[0] == "}" and curr_type != NodeType.COMMENT:
-                next_node = TexNode(curr_content.strip(), curr_type, tok[1])
+                next_node = TexTree.make_node(curr_content, curr_type, tok[1])
                 curr_node.next = next_node
                 next_node.prev = curr_node
                 return tokens, root
@@ -228,7 +624,7 @@ class TexTree(object):
         """
         if node.next:
             node.next = TexTree.prune(node.next)
-        if node.child:
+        if getattr(node, "tokens", None) is None and node.child:
             node.child = TexTree.prune(node.child)
         if node.content == "":
             if node.prev:
@@ -242,7 +638,322 @@ class TexTree(object):
         return node
 
 
-def check_localization(docs: List[str]) -> None:
+class TextBuffer(object):
+    """The contents of every TEXT node in a TexTree joined into a single
+    string, so that a regular expression can be run once over a whole
+    document instead of once per node.  Node contents never contain a
+    newline, so a newline separates successive nodes and patterns that do
+    not match it will not match across nodes.  A sorted table of the offset
+    at which each node begins maps matches back to their line number.
+
+    Args:
+        tree - the TexTree whose TEXT nodes are flattened.
+    """
+
+    SEPARATOR = "\n"
+
+    def __init__(self, tree: TexTree) -> None:
+        contents = []
+        linenos = []
+        for node in tree:
+            if node.type == NodeType.TEXT:
+                contents.append(node.content)
+                linenos.append(node.lineno)
+        self.join(contents, linenos)
+
+    @classmethod
+    def from_contents(cls, contents: List[str]) -> "TextBuffer":
+        """Flatten a list of node contents that do not come from one tree.
+
+        Args:
+            contents: the contents of each node.
+
+        Returns:
+            A TextBuffer of the contents, with all line numbers set to 0.
+        """
+        buffer = cls.__new__(cls)
+        buffer.join(contents, [0] * len(contents))
+        return buffer
+
+    def join(self, contents: List[str], linenos: List[int]) -> None:
+        """Set the buffer's text and offset table from the contents and line
+        numbers of its nodes."""
+        self.contents = contents
+        self.linenos = linenos
+        self.starts = []
+        offset = 0
+        for content in contents:
+            self.starts.append(offset)
+            offset += len(content) + len(TextBuffer.SEPARATOR)
+        self.text = TextBuffer.SEPARATOR.join(contents)
+
+    def index(self, offset: int) -> int:
+        """Return the index of the node containing an offset into the
+        buffer."""
+        return bisect.bisect_right(self.starts, offset) - 1
+
+    def lineno(self, offset: int) -> int:
+        """Return the line number of the node containing an offset into the
+        buffer."""
+        return self.linenos[self.index(offset)]
+
+    def span(self, offset: int) -> Tuple[int, int]:
+        """Return the start and end offsets of the node containing an offset
+        into the buffer."""
+        i = self.index(offset)
+        if i + 1 < len(self.starts):
+            return self.starts[i], self.starts[i + 1] - len(TextBuffer.SEPARATOR)
+        return self.starts[i], len(self.text)
+
+
+US_SPELLING = re.compile(r"(\w+zation|\w+yze|\w+yzing)\b")
+UK_SPELLING = re.compile(r"(\w+sation|\w+yse|\w+ysing)\b")
+ACRONYM = re.compile(r"\b([A-Z]{2,})\b")
+COMPOUND_WORD = re.compile(r"\b(?:\S+-\S+)\b")
+
+
+def read_buffer(doc: str) -> TextBuffer:
+    """Parse a LaTeX file and flatten the text it contains.
+
+    Args:
+        doc: path to the LaTeX file.
+
+    Returns:
+        A TextBuffer of the file's TEXT nodes.
+    """
+    with open(doc, "r") as fp:
+        return TextBuffer(TexTree(fp.read()))
+
+
+@functools.lru_cache(maxsize=None)
+def acronym_patterns(m: str) -> Tuple[re.Pattern, re.Pattern]:
+    """Compile the patterns matching the definition of an acronym, either
+    before the acronym, e.g. 'random access memory (RAM)', or after it, e.g.
+    'CPU (central processing unit)'.
+
+    Args:
+        m: the acronym.
+
+    Returns:
+        The compiled 'before' and 'after' patterns.
+    """
+    before = (
+        "("
+        + "".join([c + "\\w+\\s" for c in m[:-1]])
+        + m[-1]
+        + "\\w+|"
+        + "".join([c.lower() + "\\w+\\s" for c in m[-1]])
+        + m[-1]
+        + "\\w+)\\s+\\("
+        + m
+        + "\\)"
+    )
+    after = (
+        m
+        + "\\s\\(("
+        + "".join([c + "\\w+\\s" for c in m[:-1]])
+        + m[-1]
+        + "\\w+|"
+        + "".join([c.lower() + "\\w+\\s" for c in m[:-1]])
+        + m[-1].lower()
+        + "\\w+)\\)"
+    )
+    return re.compile(before), re.compile(after)
+
+
+def extract_localization(buffer: TextBuffer) -> List[Tuple[List[str], List[str]]]:
+    """Find the US and UK spellings in each node of a buffer."""
+    found = [([], []) for _ in buffer.contents]
+    for match in US_SPELLING.finditer(buffer.text):
+        found[buffer.index(match.start())][0].append(match.group(1))
+    for match in UK_SPELLING.finditer(buffer.text):
+        found[buffer.index(match.start())][1].append(match.group(1))
+    return found
+
+
+def extract_acronyms(buffer: TextBuffer) -> List[List[Tuple[str, List[str]]]]:
+    """Find the acronyms in each node of a buffer, each with the definitions
+    found next to it in the same node."""
+    found = [[] for _ in buffer.contents]
+    for match in ACRONYM.finditer(buffer.text):
+        m = match.group(1)
+        start, end = buffer.span(match.start())
+        definitions = []
+        for pattern in acronym_patterns(m):
+            definitions.extend(pattern.findall(buffer.text, start, end))
+        found[buffer.index(match.start())].append((m, definitions))
+    return found
+
+
+def extract_compound_words(buffer: TextBuffer) -> List[List[str]]:
+    """Find the hyphenated words in each node of a buffer."""
+    found = [[] for _ in buffer.contents]
+    for match in COMPOUND_WORD.finditer(buffer.text):
+        found[buffer.index(match.start())].append(match.group(0))
+    return found
+
+
+class FindingsCache(object):
+    """Least recently used cache of what a check extracts from the content
+    of each TEXT node, so that text repeated across files (e.g. author
+    blocks or boilerplate paragraphs) is only searched once per process.
+    Nodes missing from the cache are flattened into one buffer and searched
+    together.
+
+    Args:
+        extract - function returning the findings for each node of a
+            TextBuffer.
+        maxsize - maximum number of node contents to remember.
+    """
+
+    def __init__(
+        self, extract: Callable[[TextBuffer], List[object]], maxsize: int = 4096
+    ) -> None:
+        self.extract = extract
+        self.maxsize = maxsize
+        self.entries = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __str__(self) -> str:
+        """Summarize the cache's hit and miss counters."""
+        return f"{self.hits} hits, {self.misses} misses"
+
+    def resize(self, maxsize: int) -> None:
+        """Change the number of node contents the cache remembers, evicting
+        the least recently used ones if it holds too many."""
+        self.maxsize = maxsize
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def findings(self, buffer: TextBuffer) -> List[object]:
+        """Return the findings for each node of a buffer.  Each distinct
+        content that has to be searched counts as one miss, every other node
+        counts as a hit, including repeats of a content searched in this
+        same call.
+
+        Args:
+            buffer: flattened text of a document.
+
+        Returns:
+            A list with the findings of each node, in node order.  The
+            findings are shared with the cache and must not be modified.
+        """
+        found = [None] * len(buffer.contents)
+        missing = {}
+        for i, content in enumerate(buffer.contents):
+            if content in self.entries:
+                self.entries.move_to_end(content)
+                found[i] = self.entries[content]
+                self.hits += 1
+            elif content in missing:
+                missing[content].append(i)
+                self.hits += 1
+            else:
+                missing[content] = [i]
+                self.misses += 1
+        if missing:
+            extracted = self.extract(TextBuffer.from_contents(list(missing)))
+            for (content, indices), findings in zip(missing.items(), extracted):
+                for i in indices:
+                    found[i] = findings
+                self.entries[content] = findings
+                if len(self.entries) > self.maxsize:
+                    self.entries.popitem(last=False)
+        return found
+
+
+CACHES = {
+    "hyphenation": FindingsCache(extract_compound_words),
+    "acronyms": FindingsCache(extract_acronyms),
+    "localization": FindingsCache(extract_localization),
+}
+
+
+class Budget(object):
+    """Limits on how long the checks may run and how many findings they may
+    collect, so that checking a large project during an interactive compile
+    stays fast.  When a limit is set, files are checked most recently
+    modified first and a check stops early once the budget is exhausted.
+
+    Args:
+        ms - time budget in milliseconds, shared by every check it is
+            passed to.  None for no limit.
+        findings - number of findings after which a check stops.  None for
+            no limit.
+    """
+
+    def __init__(self, ms: Optional[int] = None, findings: Optional[int] = None):
+        self.deadline = None if ms is None else time.monotonic() + ms / 1000
+        self.findings = findings
+
+    def order(self, docs: List[str]) -> List[str]:
+        """Return the files in the order they should be checked."""
+        if self.deadline is None and self.findings is None:
+            return docs
+        return sorted(docs, key=os.path.getmtime, reverse=True)
+
+    def exhausted(self, findings: int) -> bool:
+        """Return True if a check with this many findings should stop."""
+        if self.findings is not None and findings >= self.findings:
+            return True
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    @staticmethod
+    def notice(checked: int, total: int) -> str:
+        """Return the line marking a report as partial, if it is."""
+        if checked >= total:
+            return ""
+        return (
+            f"Partial report: only {checked} of {total} files were checked "
+            "before the budget ran out.\n"
+        )
+
+
+def write_summary(
+    outdir: str,
+    name: str,
+    overview: str,
+    issues: List[str],
+    top: int,
+    details: List[str],
+    notice: str = "",
+) -> None:
+    """Replace the report files read by stylechecker.sty with a short
+    summary, so that the time TeX spends reading them does not grow with
+    the size of the project.  The full report is moved to '<name>.details',
+    which TeX never reads.
+
+    Args:
+        outdir: directory the report files are written to.
+        name: name of the check's report files, e.g. 'acronyms'.
+        overview: one line with the totals found by the check.
+        issues: descriptions of the issues found, most important first.
+        top: number of issues to include in the summary.
+        details: the full reports written by the check on this run.
+        notice: line marking the report as partial, if it is.
+    """
+    with open(os.path.join(outdir, f"{name}.details"), "w") as details_f:
+        details_f.write("\n\n".join(d for d in details if d))
+    with open(os.path.join(outdir, f"{name}.list"), "w") as list_f:
+        list_f.write(notice + overview)
+        for issue in issues[:top]:
+            list_f.write(f"\n{issue}")
+        if len(issues) > top:
+            list_f.write(f"\n...and {len(issues) - top} more, see {name}.details")
+    warnings = os.path.join(outdir, f"{name}.warnings")
+    if os.path.isfile(warnings) or len(issues) > 0:
+        with open(warnings, "w") as warn_f:
+            if len(issues) > 0:
+                warn_f.write(f"{overview} See {name}.details for the full report.")
+
+
+def check_localization(
+    docs: List[str],
+    outdir: str = ".",
+    budget: Optional[Budget] = None,
+    summary: Optional[int] = None,
+) -> None:
     """Find inconsitent use of localized spellings (e.g. analysed and
     analyzed) in the same document.  Write a list of discrepancies to
     'loc.list' and write warning messages for the discrepancies to
@@ -251,52 +962,85 @@ def check_localization(docs: List[str]) -> None:
 
     Args:
         docs: a list of files comprising the project.
+        outdir: directory the report files are written to.
+        budget: limits after which the check stops early.
+        summary: if given, write a summary of this many of the most
+            frequent issues to the report files and the full report to a
+            '.details' file.
     """
+    budget = budget if budget else Budget()
+    docs = budget.order(docs)
+    checked = 0
     us_spellings = []
     uk_spellings = []
     for doc in docs:
-        with open(doc, "r") as fp:
-            tree = TexTree(fp.read())
-            for node in tree:
-                if node.type == NodeType.TEXT:
-                    us_matches = re.findall(
-                        r"(\w+zation|\w+yze|\w+yzing)\b",
-                        node.content,
-                    )
-                    if len(us_matches) > 0:
-                        us_spellings.append((us_matches, doc, node.lineno))
-                    uk_matches = re.findall(
-                        r"(\w+sation|\w+yse|\w+ysing)\b",
-                        node.content,
-                    )
-                    if len(uk_matches) > 0:
-                        uk_spellings.append((uk_matches, doc, node.lineno))
-    with open("localization.list", "w") as list_f:
-        list_f.write("US spellings used in this document:")
-        for item in us_spellings:
-            word_list = ", ".join([f'"{x}"' for x in item[0]])
-            list_f.write(
-                f"\nIn {item[1]}, line {item[2]} the spellings: " f"{word_list} appear"
-            )
-        if len(us_spellings) == 0:
-            list_f.write(" None")
-        list_f.write("\nUK spellings used in this document:")
-        for item in uk_spellings:
-            word_list = ", ".join([f'"{x}"' for x in item[0]])
-            list_f.write(
-                f"\nIn {item[1]}, line {item[2]} the spellings: " f"{word_list} appear"
-            )
-        if len(uk_spellings) == 0:
-            list_f.write(" None")
-    with open("localization.warnings", "w") as warn_f:
-        if len(us_spellings) > 0 and len(uk_spellings) > 0:
-            warn_f.write(
-                "Both US and UK spellings are used in the same document, "
-                "please check the full build logs for details."
-            )
+        buffer = read_buffer(doc)
+        found = CACHES["localization"].findings(buffer)
+        for (us_matches, uk_matches), lineno in zip(found, buffer.linenos):
+            if len(us_matches) > 0:
+                us_spellings.append((us_matches, doc, lineno))
+            if len(uk_matches) > 0:
+                uk_spellings.append((uk_matches, doc, lineno))
+        checked += 1
+        findings = len(us_spellings) + len(uk_spellings)
+        if budget.exhausted(findings if us_spellings and uk_spellings else 0):
+            break
+    report = [Budget.notice(checked, len(docs))]
+    report.append("US spellings used in this document:")
+    for item in us_spellings:
+        word_list = ", ".join([f'"{x}"' for x in item[0]])
+        report.append(
+            f"\nIn {item[1]}, line {item[2]} the spellings: " f"{word_list} appear"
+        )
+    if len(us_spellings) == 0:
+        report.append(" None")
+    report.append("\nUK spellings used in this document:")
+    for item in uk_spellings:
+        word_list = ", ".join([f'"{x}"' for x in item[0]])
+        report.append(
+            f"\nIn {item[1]}, line {item[2]} the spellings: " f"{word_list} appear"
+        )
+    if len(uk_spellings) == 0:
+        report.append(" None")
+    warnings = ""
+    if len(us_spellings) > 0 and len(uk_spellings) > 0:
+        warnings = (
+            "Both US and UK spellings are used in the same document, "
+            "please check the full build logs for details."
+        )
+    with open(os.path.join(outdir, "localization.list"), "w") as list_f:
+        list_f.write("".join(report))
+    with open(os.path.join(outdir, "localization.warnings"), "w") as warn_f:
+        warn_f.write(warnings)
+    if summary is not None:
+        us_counts = collections.Counter(w for item in us_spellings for w in item[0])
+        uk_counts = collections.Counter(w for item in uk_spellings for w in item[0])
+        issues = []
+        if len(us_counts) > 0 and len(uk_counts) > 0:
+            minority = min(us_counts, uk_counts, key=lambda c: sum(c.values()))
+            locale = "US" if minority is us_counts else "UK"
+            issues = [
+                f'"{word}" ({locale} spelling) appears {count} time'
+                f'{"s" if count != 1 else ""}'
+                for word, count in minority.most_common()
+            ]
+        overview = (
+            f"{sum(us_counts.values())} US and {sum(uk_counts.values())} UK "
+            "spellings found."
+        )
+        notice = Budget.notice(checked, len(docs))
+        details = ["".join(report), warnings]
+        write_summary(
+            outdir, "localization", overview, issues, summary, details, notice
+        )
 
 
-def check_acronyms(docs: List[str]) -> None:
+def check_acronyms(
+    docs: List[str],
+    outdir: str = ".",
+    budget: Optional[Budget] = None,
+    summary: Optional[int] = None,
+) -> None:
     """Find all acronyms used in the document text.  Write a list of acronyms
     and their definitions to 'acronyms.list' and write warning messages for
     acronyms missing definitions to 'acryonyms.warnings'.  Currently the
@@ -309,54 +1053,62 @@ def check_acronyms(docs: List[str]) -> None:
 
     Args:
         docs: a list of files comprising the project.
+        outdir: directory the report files are written to.
+        budget: limits after which the check stops early.
+        summary: if given, write a summary of this many of the most
+            frequent issues to the report files and the full report to a
+            '.details' file.
     """
+    budget = budget if budget else Budget()
+    docs = budget.order(docs)
+    checked = 0
     acronyms = {}
+    uses = collections.Counter()
     for doc in docs:
-        with open(doc, "r") as fp:
-            tree = TexTree(fp.read())
-            for node in tree:
-                if node.type == NodeType.TEXT:
-                    matches = re.findall(r"\b([A-Z]{2,})\b", node.content)
-                    for m in matches:
-                        if m not in acronyms:
-                            acronyms[m] = []
-                        before = (
-                            "("
-                            + "".join([c + "\\w+\\s" for c in m[:-1]])
-                            + m[-1]
-                            + "\\w+|"
-                            + "".join([c.lower() + "\\w+\\s" for c in m[-1]])
-                            + m[-1]
-                            + "\\w+)\s+\\("
-                            + m
-                            + "\\)"
-                        )
-                        after = (
-                            m
-                            + "\s\\(("
-                            + "".join([c + "\\w+\\s" for c in m[:-1]])
-                            + m[-1]
-                            + "\\w+|"
-                            + "".join([c.lower() + "\\w+\\s" for c in m[:-1]])
-                            + m[-1].lower()
-                            + "\\w+)\\)"
-                        )
-                        acronyms[m].extend(re.findall(before, node.content))
-                        acronyms[m].extend(re.findall(after, node.content))
-    with open("acronyms.list", "w") as list_f:
-        list_f.write("Acronyms appearing in this document:")
-        for acronym, definitions in acronyms.items():
-            list_f.write(f'\n{acronym}: {", ".join(definitions)}')
-    with open("acronyms.warnings", "w") as warn_f:
-        for acronym, definitions in acronyms.items():
-            if len(definitions) == 0:
-                warn_f.write(f"The acronym {acronym} is possibly undefined.\n")
-        if warn_f.tell() - 1 > 0:
-            warn_f.seek(warn_f.tell() - 1)
-            warn_f.truncate()
-
-
-def check_hyphenations(docs: List[str]) -> None:
+        for found in CACHES["acronyms"].findings(read_buffer(doc)):
+            for m, definitions in found:
+                if m not in acronyms:
+                    acronyms[m] = []
+                acronyms[m].extend(definitions)
+                uses[m] += 1
+        checked += 1
+        if budget.exhausted(len([d for d in acronyms.values() if len(d) == 0])):
+            break
+    report = [Budget.notice(checked, len(docs))]
+    report.append("Acronyms appearing in this document:")
+    for acronym, definitions in acronyms.items():
+        report.append(f'\n{acronym}: {", ".join(definitions)}')
+    warnings = "\n".join(
+        f"The acronym {acronym} is possibly undefined."
+        for acronym, definitions in acronyms.items()
+        if len(definitions) == 0
+    )
+    with open(os.path.join(outdir, "acronyms.list"), "w") as list_f:
+        list_f.write("".join(report))
+    with open(os.path.join(outdir, "acronyms.warnings"), "w") as warn_f:
+        warn_f.write(warnings)
+    if summary is not None:
+        undefined = [a for a, definitions in acronyms.items() if len(definitions) == 0]
+        undefined.sort(key=lambda a: uses[a], reverse=True)
+        issues = [
+            f"The acronym {a} is possibly undefined ({uses[a]} use"
+            f'{"s" if uses[a] != 1 else ""})'
+            for a in undefined
+        ]
+        overview = (
+            f"{len(acronyms)} acronyms found, {len(undefined)} possibly undefined."
+        )
+        notice = Budget.notice(checked, len(docs))
+        details = ["".join(report), warnings]
+        write_summary(outdir, "acronyms", overview, issues, summary, details, notice)
+
+
+def check_hyphenations(
+    docs: List[str],
+    outdir: str = ".",
+    budget: Optional[Budget] = None,
+    summary: Optional[int] = None,
+) -> None:
     """Find discrepancies in hyphenation of compound words, write a detailed
     report to 'compoundwords.list' and suspected discrepancies to
     'compoundwords.warnings'.  An example of a common discrepancy is
@@ -364,50 +1116,245 @@ def check_hyphenations(docs: List[str]) -> None:
 
     Args:
         docs: a list of files comprising the project.
+        outdir: directory the report files are written to.
+        budget: limits after which the check stops early.
+        summary: if given, write a summary of this many of the most
+            frequent issues to the report files and the full report to a
+            '.details' file.
     """
-    trees = []
+    budget = budget if budget else Budget()
+    docs = budget.order(docs)
+    buffers = []
     compound_words = {}
     for doc in docs:
-        with open(doc, "r") as fp:
-            tree = TexTree(fp.read())
-            for node in tree:
-                if node.type == NodeType.TEXT:
-                    matches = re.findall(r"\b(?:\S+-\S+)\b", node.content)
-                    for m in matches:
-                        if m not in compound_words:
-                            compound_words[m] = []
-                        compound_words[m].append((doc, node.lineno))
-            trees.append((tree, doc))
+        buffer = read_buffer(doc)
+        found = CACHES["hyphenation"].findings(buffer)
+        for matches, lineno in zip(found, buffer.linenos):
+            for m in matches:
+                if m not in compound_words:
+                    compound_words[m] = []
+                compound_words[m].append((doc, lineno))
+        buffers.append((buffer, doc))
+        if budget.exhausted(0):
+            break
+    patterns = [
+        (word, re.compile("\\b" + "[^-\\n]?".join(word.split("-")) + "\\b"))
+        for word in compound_words
+    ]
+    checked = 0
     mismatches = {}
-    for tree, doc in trees:
-        for node in tree:
-            if node.type == NodeType.TEXT:
-                for word in compound_words:
-                    matches = re.findall(
-                        f'\\b{"[^-]?".join(re.split("[-]", word))}\\b', node.content
-                    )
-                    for m in matches:
-                        if word not in mismatches:
-                            mismatches[word] = []
-                        mismatches[word].append((doc, node.lineno, m))
-    with open("hyphenations.list", "w") as list_f:
-        list_f.write("Hyphenated words appearing in this document:")
-        for word, appearances in compound_words.items():
-            list_f.write(
-                f"\n{word} appears {len(appearances)} time"
-                f'{"s" if len(appearances) != 1 else ""}'
+    for buffer, doc in buffers:
+        found = []
+        for order, (word, pattern) in enumerate(patterns):
+            for match in pattern.finditer(buffer.text):
+                found.append((buffer.index(match.start()), order, match, word))
+        found.sort(key=lambda f: f[:2])
+        for i, _, match, word in found:
+            if word not in mismatches:
+                mismatches[word] = []
+            mismatches[word].append((doc, buffer.linenos[i], match.group(0)))
+        checked += 1
+        if budget.exhausted(len(mismatches)):
+            break
+    report = [Budget.notice(checked, len(docs))]
+    report.append("Hyphenated words appearing in this document:")
+    for word, appearances in compound_words.items():
+        report.append(
+            f"\n{word} appears {len(appearances)} time"
+            f'{"s" if len(appearances) != 1 else ""}'
+        )
+    warnings = []
+    for word, appearances in mismatches.items():
+        locations = ", ".join(
+            [f'"{a[2]}" in {a[0]} on line {a[1]}' for a in appearances]
+        )
+        warnings.append(f'"{word}" also appears as {locations}')
+    with open(os.path.join(outdir, "hyphenations.list"), "w") as list_f:
+        list_f.write("".join(report))
+    if len(mismatches) > 0:
+        with open(os.path.join(outdir, "hyphenations.warnings"), "w") as warn_f:
+            warn_f.write("\n".join(warnings))
+    if summary is not None:
+        ranked = sorted(mismatches.items(), key=lambda m: len(m[1]), reverse=True)
+        issues = []
+        for word, appearances in ranked:
+            variants = ", ".join(
+                f'"{v}"' for v in dict.fromkeys(a[2] for a in appearances)
             )
-    if len(mismatches) == 0:
-        return
-    with open("hyphenations.warnings", "w+") as warn_f:
-        for word, appearances in mismatches.items():
-            locations = ", ".join(
-                [f'"{a[2]}" in {a[0]} on line {a[1]}' for a in appearances]
+            issues.append(
+                f'"{word}" also appears as {variants} ({len(appearances)} time'
+                f'{"s" if len(appearances) != 1 else ""})'
             )
-            warn_f.write(f'"{word}" also appears as {locations}\n')
-        if warn_f.tell() - 1 > 0:
-            warn_f.seek(warn_f.tell() - 1)
-            warn_f.truncate()
+        overview = (
+            f"{len(compound_words)} hyphenated words found, {len(mismatches)} "
+            "hyphenated inconsistently."
+        )
+        notice = Budget.notice(checked, len(docs))
+        details = ["".join(report), "\n".join(warnings)]
+        write_summary(
+            outdir, "hyphenations", overview, issues, summary, details, notice
+        )
+
+
+CHECKS = {
+    "hyphenation": check_hyphenations,
+    "acronyms": check_acronyms,
+    "localization": check_localization,
+}
+
+
+def find_tex_files(root: str = ".") -> List[str]:
+    """Find all files with the *.tex extension in a directory and its
+    children.
+
+    Args:
+        root: directory to search.
+
+    Returns:
+        A list of paths to the LaTeX files found.
+    """
+    tex_files = []
+    for dirpath, _, files in os.walk(root):
+        for f in files:
+            if f.endswith(".tex"):
+                tex_files.append(os.path.join(dirpath, f))
+    return tex_files
+
+
+def check_project(
+    root: str,
+    checks: List[str],
+    files: Optional[List[str]] = None,
+    budget_ms: Optional[int] = None,
+    max_findings: Optional[int] = None,
+    summary: Optional[int] = None,
+    cache_size: Optional[int] = None,
+) -> Dict[str, Tuple[int, int]]:
+    """Run the requested checks over a single project and write its reports
+    to the project's root directory.
+
+    Args:
+        root: root directory of the project.
+        checks: names of the checks to run (keys of CHECKS).
+        files: files comprising the project.  If omitted all *.tex files
+            under root are checked.
+        budget_ms: time budget in milliseconds shared by all the checks.
+        max_findings: number of findings after which each check stops.
+        summary: number of issues to summarize in the report files read by
+            stylechecker.sty, or None to write the full reports there.
+        cache_size: number of node contents each check's FindingsCache
+            remembers, or None to leave the caches as they are.
+
+    Returns:
+        A dictionary mapping the name of each check to the number of cache
+        hits and misses while checking this project.
+    """
+    tex_files = files if files else find_tex_files(root)
+    budget = Budget(budget_ms, max_findings)
+    stats = {}
+    for name in checks:
+        cache = CACHES[name]
+        if cache_size is not None:
+            cache.resize(cache_size)
+        hits, misses = cache.hits, cache.misses
+        CHECKS[name](tex_files, root, budget, summary)
+        stats[name] = (cache.hits - hits, cache.misses - misses)
+    return stats
+
+
+def read_manifest(path: str) -> List[str]:
+    """Read a list of project roots from a manifest file.  Each non-empty
+    line is one project root; lines beginning with '#' are ignored.
+    Relative roots are resolved against the manifest's directory.
+
+    Args:
+        path: path to the manifest file.
+
+    Returns:
+        A list of project root directories.
+    """
+    base = os.path.dirname(path)
+    roots = []
+    with open(path, "r") as fp:
+        for line in fp:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                roots.append(os.path.join(base, line))
+    return roots
+
+
+def check_batch(
+    roots: List[str],
+    checks: List[str],
+    jobs: Optional[int] = None,
+    budget_ms: Optional[int] = None,
+    max_findings: Optional[int] = None,
+    summary: Optional[int] = None,
+    cache_size: Optional[int] = None,
+) -> Tuple[Dict[str, Dict[str, Tuple[int, int]]], Dict[str, str]]:
+    """Check many independent projects on a shared pool of worker processes.
+    Each project is checked in isolation and gets its own reports, written
+    to its root directory.
+
+    Args:
+        roots: root directories of the projects to check.
+        checks: names of the checks to run (keys of CHECKS).
+        jobs: number of worker processes, defaults to the number of CPUs.
+        budget_ms: time budget in milliseconds for each project.
+        max_findings: number of findings after which each check stops.
+        summary: number of issues to summarize in each project's reports.
+        cache_size: number of node contents each worker's caches remember.
+
+    Returns:
+        A tuple of two dictionaries.  The first maps the root of each
+        project that was checked to its cache hits and misses per check, as
+        returned by check_project.  The second maps the root of each project
+        that could not be checked to the reason why.
+    """
+    stats = {}
+    failures = {}
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {
+            pool.submit(
+                check_project,
+                root,
+                checks,
+                None,
+                budget_ms,
+                max_findings,
+                summary,
+                cache_size,
+            ): root
+            for root in roots
+        }
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                stats[futures[future]] = future.result()
+            except Exception as err:
+                failures[futures[future]] = str(err)
+    return stats, failures
+
+
+def non_negative_int(value: str) -> int:
+    """Parse a command line argument that must be an integer of at least 0.
+
+    Args:
+        value: the argument as given on the command line.
+
+    Returns:
+        The parsed integer.
+
+    Raises:
+        argparse.ArgumentTypeError: if the value is not a non-negative
+            integer.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        number = -1
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"{value!r} is not a non-negative integer")
+    return number
 
 
 if __name__ == "__main__":
@@ -437,18 +1384,88 @@ if __name__ == "__main__":
         help="Check that words with two or more acceptable spellings are "
         "consistent.",
     )
+    parser.add_argument(
+        "--batch",
+        nargs="+",
+        default=[],
+        metavar="ROOT",
+        help="Root directories of independent projects to check in one "
+        "invocation.  Reports are written to each project's root.",
+    )
+    parser.add_argument(
+        "--manifest",
+        help="Path to a file listing one project root per line to check in "
+        "batch mode.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of worker processes used in batch mode.  Defaults to "
+        "the number of CPUs.",
+    )
+    parser.add_argument(
+        "--budget-ms",
+        type=int,
+        default=None,
+        help="Stop checking once this many milliseconds have elapsed.  Files "
+        "are checked most recently modified first and the report is marked "
+        "as partial.",
+    )
+    parser.add_argument(
+        "--max-findings",
+        type=int,
+        default=None,
+        help="Stop each check once it has found this many issues.  Files are "
+        "checked most recently modified first and the report is marked as "
+        "partial.",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=non_negative_int,
+        default=4096,
+        help="Number of distinct text nodes whose findings each check "
+        "remembers, so repeated text is only searched once.",
+    )
+    parser.add_argument(
+        "--summary",
+        type=non_negative_int,
+        default=None,
+        metavar="N",
+        help="Write only the totals and the N most frequent issues to the "
+        "*.list and *.warnings files read by stylechecker.sty, and the full "
+        "report to a *.details file.",
+    )
     args = parser.parse_args()
-    tex_files = []
-    if len(args.files) <= 0:
-        for root, _, files in os.walk("."):
-            for f in files:
-                if f.endswith(".tex"):
-                    tex_files.append(os.path.join(root, f))
-    else:
-        tex_files = args.files
-    if args.hyphenation:
-        check_hyphenations(tex_files)
-    if args.acronyms:
-        check_acronyms(tex_files)
-    if args.localization:
-        check_localization(tex_files)
+    checks = [name for name in CHECKS if getattr(args, name)]
+    roots = list(args.batch)
+    if args.manifest:
+        roots.extend(read_manifest(args.manifest))
+    if len(roots) > 0:
+        stats, failures = check_batch(
+            roots,
+            checks,
+            args.jobs,
+            args.budget_ms,
+            args.max_findings,
+            args.summary,
+            args.cache_size,
+        )
+        for root, project_stats in stats.items():
+            for name, (hits, misses) in project_stats.items():
+                print(f"{root}: {name} cache: {hits} hits, {misses} misses")
+        for root, reason in failures.items():
+            print(f"Unable to check {root}: {reason}")
+        sys.exit(1 if len(failures) > 0 else 0)
+    stats = check_project(
+        ".",
+        checks,
+        args.files,
+        args.budget_ms,
+        args.max_findings,
+        args.summary,
+        args.cache_size,
+    )
+    for name, (hits, misses) in stats.items():
+        print(f"{name} cache: {hits} hits, {misses} misses")
@@ -4,18 +4,30 @@
 from typing import Dict, NamedTuple
 
 
+import concurrent.futures
+import multiprocessing
 import os
+import shutil
+import struct
 import sys
+import tempfile
 import unittest
 
 
 sys.path.append("..")  # BAD! find a work around to import without installing
 from stylechecker import (
+    Budget,
     NodeType,
     TexTree,
+    TextBuffer,
+    FindingsCache,
+    extract_acronyms,
     check_localization,
     check_acronyms,
     check_hyphenations,
+    check_batch,
+    check_project,
+    read_manifest,
 )
 
 
@@ -157,6 +169,180 @@ class TestTexTree(unittest.TestCase):
             tree = TexTree(fp.read())
             self.assertEqual(ground_truth, str(tree))
 
+    def test_serialization(self) -> None:
+        """Check that a tree survives a round trip through the binary
+        format."""
+        with open(os.path.join("test", "test_valid.tex"), "r") as fp:
+            tex = fp.read() + "\\emph{naïve café}\n"
+        tree = TexTree.loads(TexTree(tex).dumps())
+        self.assertEqual(str(TexTree(tex)), str(tree))
+        tree2list = list(tree)
+        ground_truth = list(TexTree(tex))
+        self.assertEqual(len(ground_truth), len(tree2list))
+        for node, gt_node in zip(tree2list, ground_truth):
+            self.assertEqual(gt_node.content, node.content)
+            self.assertEqual(gt_node.type, node.type)
+            self.assertEqual(gt_node.lineno, node.lineno)
+        with self.assertRaises(ValueError):
+            TexTree.loads(b"TXTR\xff\xff" + TexTree(tex).dumps()[6:])
+
+    def test_serialization_truncated(self) -> None:
+        """Check that truncated or padded data is rejected instead of
+        producing a partial tree."""
+        with open(os.path.join("test", "test_valid.tex"), "r") as fp:
+            data = TexTree(fp.read()).dumps()
+        for corrupt in [data[:-8], data[:-1], data[:10], data[:3], data + b"\0"]:
+            with self.assertRaises(ValueError):
+                TexTree.loads(corrupt)
+        self.assertIsNone(TexTree.loads(TexTree("").dumps()).root)
+
+    def test_serialization_corrupt(self) -> None:
+        """Check that node tables with cycles, shared nodes or unnamed
+        commands are rejected instead of hanging or failing to index."""
+        with open(os.path.join("test", "test_valid.tex"), "r") as fp:
+            tree = TexTree(fp.read())
+        data = tree.dumps()
+        n_nodes = TexTree.HEADER.unpack_from(data)[2]
+        nexts = len(data) - 4 * n_nodes
+        children = nexts - 4 * n_nodes
+        for offset, link in [(nexts, 0), (nexts, 1), (children, 2), (children, 0)]:
+            corrupt = data[:offset] + struct.pack("<i", link) + data[offset + 4 :]
+            with self.assertRaises(ValueError):
+                TexTree.loads(corrupt)
+        tree.root.content = "documentclass"
+        with self.assertRaises(ValueError):
+            TexTree.loads(tree.dumps())
+
+    def test_command_index(self) -> None:
+        """Check that commands and environments can be looked up by name,
+        including in a deserialized tree."""
+        with open(os.path.join("test", "test_valid.tex"), "r") as fp:
+            tree = TexTree(fp.read())
+        for t in [tree, TexTree.loads(tree.dumps())]:
+            usepackage = t.commands("usepackage")
+            self.assertEqual(["stylechecker"], [n.child.content for n in usepackage])
+            self.assertEqual([7], [n.lineno for n in t.commands("\\textbf")])
+            command = t.commands("command")
+            self.assertEqual(["\\command[arg1][arg2]"], [n.content for n in command])
+            self.assertEqual([3], [n.lineno for n in t.environments("document")])
+            self.assertEqual([], t.commands("input"))
+            self.assertEqual([], t.environments("verbatim"))
+
+    def test_command_index_pruned(self) -> None:
+        """Check that the index only holds commands that are in the tree, so
+        eager, lazy and deserialized trees find the same commands."""
+        tex = (
+            "Intro\n{\\input{chapter1}}\n"
+            "\\textit{a \\textbf{b} \\input{chapter2}} \\input{chapter3}\n"
+        )
+        eager = TexTree(tex)
+        lazy = TexTree(tex, lazy=True)
+        str(lazy)
+        trees = [eager, lazy, TexTree.loads(eager.dumps())]
+        for name in ["input", "textit", "textbf"]:
+            found = [[(n.content, n.lineno) for n in t.commands(name)] for t in trees]
+            self.assertEqual(found[0], found[1])
+            self.assertEqual(found[0], found[2])
+        chapters = [n.child.content for n in eager.commands("input")]
+        self.assertEqual(["chapter2", "chapter3"], chapters)
+        reached = str(eager).count("NodeType.COMMAND")
+        self.assertEqual(reached, sum(len(n) for n in eager.index.values()))
+
+    def test_lazy(self) -> None:
+        """Check that a lazily parsed tree matches an eagerly parsed one and
+        that brace groups are only parsed once their child is accessed."""
+        with open(os.path.join("test", "test_valid.tex"), "r") as fp:
+            tex = fp.read() + "\n\\textsc{\\emph{a % }\n{b}}}\n"
+        tree = TexTree(tex, lazy=True)
+        self.assertEqual([], tree.commands("emph"))
+        textit = tree.commands("textit")[0]
+        self.assertIn("parsed=False", repr(textit))
+        self.assertEqual(TexTree(tex, lazy=True).commands("textit")[0], textit)
+        self.assertIsNotNone(textit.tokens)
+        self.assertEqual([], tree.commands("textbf"))
+        self.assertEqual("This line contains", textit.child.content)
+        self.assertIsNone(textit.tokens)
+        self.assertEqual([7], [n.lineno for n in tree.commands("textbf")])
+        self.assertEqual(str(TexTree(tex)), str(tree))
+        self.assertEqual([10], [n.lineno for n in tree.commands("emph")])
+        tree = TexTree("\\textit{\\emph{a}} \\emph{b}\n", lazy=True)
+        self.assertEqual(["b"], [n.child.content for n in tree.commands("emph")])
+        str(tree)
+        emph = tree.commands("emph")
+        self.assertEqual(["a", "b"], [n.child.content for n in emph])
+        tex = "\\textit{x \\emph{y}}\n"
+        first, second = [TexTree(tex, lazy=True).commands("textit")[0] for _ in "ab"]
+        self.assertEqual("x", first.child.content)
+        self.assertNotEqual(first, second)
+        self.assertEqual("x", second.child.content)
+        self.assertEqual(first, second)
+        second.child.next.child.content = "z"
+        self.assertNotEqual(first, second)
+
+
+class TestTextBuffer(unittest.TestCase):
+    """Test case for the flattened text of a TexTree."""
+
+    def test_offsets(self) -> None:
+        """Check that the buffer contains every TEXT node and that offsets map
+        back to the node and line they came from."""
+        with open(os.path.join("test", "test_valid.tex"), "r") as fp:
+            tex = fp.read()
+        buffer = TextBuffer(TexTree(tex))
+        texts = [n.content for n in TexTree(tex) if n.type == NodeType.TEXT]
+        self.assertEqual("\n".join(texts), buffer.text)
+        offset = buffer.text.index("nested")
+        self.assertEqual(7, buffer.lineno(offset))
+        start, end = buffer.span(offset)
+        self.assertEqual("nested", buffer.text[start:end])
+        self.assertEqual((start, end), buffer.span(end - 1))
+        start, end = buffer.span(len(buffer.text) - 1)
+        self.assertEqual("document", buffer.text[start:end])
+        self.assertEqual(9, buffer.lineno(start))
+
+
+class TestFindingsCache(unittest.TestCase):
+    """Test case for the LRU cache of per-node findings."""
+
+    def test_hits(self) -> None:
+        """Check that repeated content is only searched once and that the
+        findings still map to the right nodes."""
+        cache = FindingsCache(extract_acronyms)
+        contents = ["CPU (Central Processing Unit)", "no acronyms", "RAM"]
+        found = cache.findings(TextBuffer.from_contents(contents))
+        self.assertEqual(
+            [[("CPU", ["Central Processing Unit"])], [], [("RAM", [])]], found
+        )
+        self.assertEqual((0, 3), (cache.hits, cache.misses))
+        found = cache.findings(TextBuffer.from_contents(contents[::-1] + ["RAM"]))
+        self.assertEqual(
+            [[("RAM", [])], [], [("CPU", ["Central Processing Unit"])], [("RAM", [])]],
+            found,
+        )
+        self.assertEqual("4 hits, 3 misses", str(cache))
+        found = cache.findings(TextBuffer.from_contents(["GPU", "x", "GPU"]))
+        self.assertEqual([[("GPU", [])], [], [("GPU", [])]], found)
+        self.assertEqual("5 hits, 5 misses", str(cache))
+
+    def test_resize(self) -> None:
+        """Check that shrinking the cache evicts the least recently used
+        content, down to an empty cache."""
+        cache = FindingsCache(extract_acronyms)
+        cache.findings(TextBuffer.from_contents(["A", "B", "C"]))
+        cache.resize(1)
+        self.assertEqual(["C"], list(cache.entries))
+        cache.resize(0)
+        self.assertEqual([], list(cache.entries))
+
+    def test_eviction(self) -> None:
+        """Check that the least recently used content is evicted first."""
+        cache = FindingsCache(extract_acronyms, maxsize=2)
+        cache.findings(TextBuffer.from_contents(["A", "B"]))
+        cache.findings(TextBuffer.from_contents(["A", "C"]))
+        self.assertEqual(["A", "C"], list(cache.entries))
+        cache.findings(TextBuffer.from_contents(["B"]))
+        self.assertEqual((1, 4), (cache.hits, cache.misses))
+
 
 class TestCheckHyphenations(unittest.TestCase):
     """Test case for the hyphenation checking function."""
@@ -239,6 +425,16 @@ class TestCheckHyphenations(unittest.TestCase):
         with open("hyphenations.warnings", "r") as warning_f:
             self.assertEqual(warnings_gt, warning_f.read())
 
+    def test_first_node(self) -> None:
+        """Test that a variant in the first node of a file is reported."""
+        warnings_gt = (
+            '"fox-in-socks" also appears as "fox in socks" in test/test_hyphena'
+            "tion_first_node.tex on line 1"
+        )
+        check_hyphenations([os.path.join("test", "test_hyphenation_first_node.tex")])
+        with open("hyphenations.warnings", "r") as warning_f:
+            self.assertEqual(warnings_gt, warning_f.read())
+
     def test_nowarnings(self) -> None:
         """Test the case when no hyphenation warnings are present."""
         list_gt = "Hyphenated words appearing in this document:"
@@ -332,5 +528,194 @@ class TestCheckLocalization(unittest.TestCase):
             self.assertEqual(warnings_gt, warning_f.read())
 
 
+class TestBudget(unittest.TestCase):
+    """Test case for time- and findings-budgeted checking."""
+
+    def setUp(self) -> None:
+        """Copy two test documents to a temporary directory, with the acronym
+        document modified most recently."""
+        self.maxDiff = 2048
+        self.tmpdir = tempfile.mkdtemp()
+        self.docs = []
+        for mtime, name in enumerate(["test_hyphenation_mf1.tex", "test_acronyms.tex"]):
+            shutil.copy(os.path.join("test", name), self.tmpdir)
+            self.docs.append(os.path.join(self.tmpdir, name))
+            os.utime(self.docs[-1], (mtime, mtime))
+
+    def tearDown(self) -> None:
+        """Delete the temporary directory."""
+        shutil.rmtree(self.tmpdir)
+
+    def test_order(self) -> None:
+        """Check that files are only reordered when a limit is set."""
+        self.assertEqual(self.docs, Budget().order(self.docs))
+        self.assertEqual(self.docs[::-1], Budget(findings=1).order(self.docs))
+
+    def test_max_findings(self) -> None:
+        """Check that a check stops once enough findings are collected and
+        marks its report as partial."""
+        list_gt = (
+            "Partial report: only 1 of 2 files were checked before the budget "
+            "ran out.\n"
+            "Acronyms appearing in this document:\n"
+            "CPU: Central Processing Unit\n"
+            "GPU: Graphical Processing Unit\n"
+            "RAM: "
+        )
+        check_acronyms(self.docs, self.tmpdir, Budget(findings=1))
+        with open(os.path.join(self.tmpdir, "acronyms.list"), "r") as list_f:
+            self.assertEqual(list_gt, list_f.read())
+
+    def test_time(self) -> None:
+        """Check that an exhausted time budget still checks the most recently
+        modified file."""
+        check_hyphenations(self.docs, self.tmpdir, Budget(ms=0))
+        with open(os.path.join(self.tmpdir, "hyphenations.list"), "r") as list_f:
+            self.assertTrue(list_f.read().startswith("Partial report: only 1 of 2"))
+
+    def test_complete(self) -> None:
+        """Check that a report is not marked as partial when every file fits
+        in the budget."""
+        check_acronyms(self.docs, self.tmpdir, Budget(ms=60000, findings=10))
+        with open(os.path.join(self.tmpdir, "acronyms.list"), "r") as list_f:
+            self.assertTrue(list_f.read().startswith("Acronyms appearing"))
+
+
+class TestSummary(unittest.TestCase):
+    """Test case for summary-first report files."""
+
+    def setUp(self) -> None:
+        """Write reports to a temporary directory."""
+        self.maxDiff = 2048
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self) -> None:
+        """Delete the temporary directory."""
+        shutil.rmtree(self.tmpdir)
+
+    def read(self, name: str) -> str:
+        """Return the contents of a report file."""
+        with open(os.path.join(self.tmpdir, name), "r") as fp:
+            return fp.read()
+
+    def test_hyphenations(self) -> None:
+        """Check that only the most frequent issues are summarized and that
+        the full report is kept in the details file."""
+        list_gt = (
+            "5 hyphenated words found, 5 hyphenated inconsistently.\n"
+            '"fox-in" also appears as "fox in", "fox~in" (6 times)\n'
+            '"in-socks" also appears as "in socks", "in~socks" (6 times)\n'
+            "...and 3 more, see hyphenations.details"
+        )
+        warnings_gt = (
+            "5 hyphenated words found, 5 hyphenated inconsistently. See "
+            "hyphenations.details for the full report."
+        )
+        doc = os.path.join("test", "test_hyphenation.tex")
+        check_hyphenations([doc], self.tmpdir)
+        details_gt = (
+            self.read("hyphenations.list") + "\n\n" + self.read("hyphenations.warnings")
+        )
+        check_hyphenations([doc], self.tmpdir, summary=2)
+        self.assertEqual(list_gt, self.read("hyphenations.list"))
+        self.assertEqual(warnings_gt, self.read("hyphenations.warnings"))
+        self.assertEqual(details_gt, self.read("hyphenations.details"))
+
+    def test_fixed_issues(self) -> None:
+        """Check that warnings fixed since the last run are not carried over
+        into the details file."""
+        doc = os.path.join(self.tmpdir, "doc.tex")
+        with open(doc, "w") as fp:
+            fp.write("We tune the hyper-parameters and the hyperparameters.\n")
+        check_hyphenations([doc], self.tmpdir, summary=2)
+        self.assertIn("also appears as", self.read("hyphenations.details"))
+        with open(doc, "w") as fp:
+            fp.write("We tune the hyper-parameters and the hyper-parameters.\n")
+        check_hyphenations([doc], self.tmpdir, summary=2)
+        self.assertEqual(
+            "Hyphenated words appearing in this document:\n"
+            "hyper-parameters appears 2 times",
+            self.read("hyphenations.details"),
+        )
+        self.assertEqual("", self.read("hyphenations.warnings"))
+
+    def test_no_issues(self) -> None:
+        """Check that no warning is written when there is nothing to fix."""
+        doc = os.path.join("test", "test_localization_no_error.tex")
+        check_localization([doc], self.tmpdir, summary=0)
+        self.assertEqual(
+            "0 US and 0 UK spellings found.", self.read("localization.list")
+        )
+        self.assertEqual("", self.read("localization.warnings"))
+
+    def test_acronyms(self) -> None:
+        """Check that undefined acronyms are summarized with their uses."""
+        doc = os.path.join("test", "test_acronyms.tex")
+        check_acronyms([doc], self.tmpdir, summary=10)
+        self.assertEqual(
+            "3 acronyms found, 1 possibly undefined.\n"
+            "The acronym RAM is possibly undefined (1 use)",
+            self.read("acronyms.list"),
+        )
+
+
+class TestCheckBatch(unittest.TestCase):
+    """Test case for checking several projects in one invocation."""
+
+    def setUp(self) -> None:
+        """Create one temporary project directory per test document."""
+        self.tmpdir = tempfile.mkdtemp()
+        self.roots = []
+        for name in ["test_acronyms.tex", "test_hyphenation_mf1.tex"]:
+            root = os.path.join(self.tmpdir, name[:-4])
+            os.mkdir(root)
+            shutil.copy(os.path.join("test", name), root)
+            self.roots.append(root)
+
+    def tearDown(self) -> None:
+        """Delete the temporary project directories."""
+        shutil.rmtree(self.tmpdir)
+
+    def test_isolated_reports(self) -> None:
+        """Check that each project gets its own reports and that findings in
+        one project do not leak into another."""
+        stats, failures = check_batch(self.roots, ["acronyms", "hyphenation"], 2)
+        self.assertEqual({}, failures)
+        self.assertEqual(set(self.roots), set(stats))
+        for project_stats in stats.values():
+            self.assertEqual({"acronyms", "hyphenation"}, set(project_stats))
+        with open(os.path.join(self.roots[0], "acronyms.warnings"), "r") as warn_f:
+            self.assertEqual("The acronym RAM is possibly undefined.", warn_f.read())
+        with open(os.path.join(self.roots[1], "acronyms.list"), "r") as list_f:
+            self.assertEqual("Acronyms appearing in this document:", list_f.read())
+        with open(os.path.join(self.roots[1], "acronyms.warnings"), "r") as warn_f:
+            self.assertEqual("", warn_f.read())
+        for root in self.roots:
+            self.assertTrue(os.path.isfile(os.path.join(root, "hyphenations.list")))
+
+    def test_cache_size(self) -> None:
+        """Check that the cache size reaches the workers however they are
+        started and that cache counters are reported for each project."""
+        context = multiprocessing.get_context("spawn")
+        with concurrent.futures.ProcessPoolExecutor(1, mp_context=context) as pool:
+            stats = []
+            for cache_size in [1, 1, 4096, 4096]:
+                future = pool.submit(
+                    check_project, self.roots[0], ["acronyms"], cache_size=cache_size
+                )
+                stats.append(future.result()["acronyms"])
+        self.assertEqual((1, 7), stats[0])
+        self.assertGreater(stats[1][1], 0)
+        self.assertEqual((8, 0), stats[3])
+
+    def test_manifest(self) -> None:
+        """Check that relative roots in a manifest are resolved against the
+        manifest's directory and comments are skipped."""
+        manifest = os.path.join(self.tmpdir, "projects.txt")
+        with open(manifest, "w") as fp:
+            fp.write("# nightly run\ntest_acronyms\n\ntest_hyphenation_mf1\n")
+        self.assertEqual(self.roots, read_manifest(manifest))
+
+
 if __name__ == "__main__":
     unittest.main()